@@ -9,7 +9,7 @@ from datetime import date, timedelta, datetime, timezone
 from .core.database import create_db_and_tables, get_async_db, engine as async_engine 
 from . import models, schemas # crud is not directly used here now
 from .api import api_keys_router, volume_router
-from .services.aggregation_service import AggregationService
+from .services.aggregation_service import AggregationService, close_shared_connectors
 from .core.cache import startup_redis_pool, shutdown_redis_pool, set_cache
 from .core.config import settings # For HISTORICAL_DATA_FETCH_DAYS
 
@@ -89,6 +89,9 @@ async def lifespan(app: FastAPI):
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler shut down.")
+
+    await close_shared_connectors()
+    logger.info("Exchange connector HTTP clients closed.")
     
     # Dispose the engine to close all connections
     await async_engine.dispose()
@@ -0,0 +1,37 @@
+"""
+Numba-compiled numeric kernels used by the exchange connectors.
+Compiled on first call; cache=True stores the machine code on disk so later
+processes skip the compile step. nogil=True releases the GIL while a kernel runs,
+so callers offloading work via asyncio.to_thread don't stall the event loop.
+"""
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def aggregate_ohlcv(day, price, quote_volume, out_day, out_open, out_high, out_low, out_close, out_volume):
+    """
+    Single pass over trades sorted by day (and by time within a day) that writes
+    one open/high/low/close/volume row per distinct day into the out_* arrays.
+    out_* arrays must hold at least len(day) rows and out_volume must be zeroed.
+    Returns the number of days written.
+    """
+    n = day.shape[0]
+    k = -1
+    current_day = -1
+    for i in range(n):
+        d = day[i]
+        p = price[i]
+        if k < 0 or d != current_day:
+            k += 1
+            current_day = d
+            out_day[k] = d
+            out_open[k] = p
+            out_high[k] = p
+            out_low[k] = p
+        if p > out_high[k]:
+            out_high[k] = p
+        if p < out_low[k]:
+            out_low[k] = p
+        out_close[k] = p # Last trade of the day will set this
+        out_volume[k] += quote_volume[i]
+    return k + 1
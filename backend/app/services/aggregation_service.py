@@ -29,6 +29,26 @@ COINGECKO_TOKEN_ID_CACHE: Dict[str, Optional[str]] = {}
 PRICE_CACHE: Dict[str, Dict[str, Any]] = {} # Key: coingecko_id, Value: {"price": float, "timestamp": datetime}
 PRICE_CACHE_TTL_SECONDS = 5 * 60  # Cache prices for 5 minutes
 
+# Connectors are shared across AggregationService instances so their pooled HTTP clients
+# (and keep-alive connections) outlive a single request or scheduler run.
+SHARED_CONNECTORS: Dict[str, BaseExchangeConnector] = {
+    # "bybit": BybitConnector(),
+    "woox": WooXConnector(),
+    # "hyperliquid": HyperliquidConnector(),
+    "paradex": ParadexConnector(),
+}
+
+async def close_shared_connectors():
+    """
+    Closes the network resources held by the shared connectors.
+    Call this function during application shutdown.
+    """
+    for platform_name, connector in SHARED_CONNECTORS.items():
+        try:
+            await connector.aclose()
+        except Exception as e:
+            logger.error(f"Error closing connector for {platform_name}: {e}")
+
 class AggregationService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -38,12 +58,7 @@ class AggregationService:
             # "hyperliquid": ["BTC", "ETH"],
             "paradex": ["BTC-USD-PERP", "ETH-USD-PERP"], # Paradex might use different symbol formats
         }
-        self.connectors: Dict[str, BaseExchangeConnector] = {
-            # "bybit": BybitConnector(),
-            "woox": WooXConnector(),
-            # "hyperliquid": HyperliquidConnector(),
-            "paradex": ParadexConnector(),
-        }
+        self.connectors: Dict[str, BaseExchangeConnector] = SHARED_CONNECTORS
 
     async def _get_active_api_key_for_platform(self, platform_name: str) -> Optional[api_key_schema.APIKeyDecrypted]:
         api_key_record = await crud_api_key.get_api_key_by_platform(self.db, platform_name=platform_name)
@@ -372,7 +387,8 @@ class AggregationService:
             # Assuming get_latest_24h_volume can sum up volumes for all its relevant symbols
             # Or, it might need to be called per symbol if the API doesn't provide a total
             # For now, let's assume it returns total 24h volume for the platform
-            connector_tasks.append(connector.get_latest_24h_volume(auth_params=auth_params))
+            # Connectors without an account-wide total (e.g. WOO X) sum volume over the configured symbols
+            connector_tasks.append(connector.get_latest_24h_volume(auth_params=auth_params, symbols=platform_symbols))
 
 
         results = await asyncio.gather(*connector_tasks, return_exceptions=True)
@@ -415,7 +431,9 @@ class AggregationService:
         try:
             # This assumes get_latest_24h_volume sums up all relevant symbols for the platform
             # If it needs a symbol, this design needs adjustment or the connector needs to handle it.
-            platform_volume_info = await connector.get_latest_24h_volume(auth_params=auth_params)
+            platform_volume_info = await connector.get_latest_24h_volume(
+                auth_params=auth_params, symbols=self.platform_symbol_map.get(platform_name, [])
+            )
             if platform_volume_info:
                 return platform_volume_info
             else:
@@ -4,6 +4,7 @@ from typing import List, Dict, Any, Optional
 from decimal import Decimal
 import httpx # Using httpx for async requests
 
+from .... import schemas
 from ....schemas import HistoricalVolumeRecord # Adjusted import path
 from ....models.api_key import PlatformEnum # Adjusted import path
 
@@ -15,11 +16,21 @@ class BaseExchangeConnector(ABC):
     # Default timeout for HTTP requests
     REQUEST_TIMEOUT = 30  # seconds
 
-    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, extra_auth_params: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        extra_auth_params: Optional[Dict[str, Any]] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.extra_auth_params = extra_auth_params # For things like wallet addresses, JWTs, etc.
         self.base_url = self.get_base_url()
+        # An injected client can be shared by several connectors (requests use absolute URLs);
+        # otherwise one is created lazily and reused across fetches so connections stay warm
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
 
     @abstractmethod
     def get_platform_name(self) -> PlatformEnum:
@@ -131,15 +142,38 @@ class BaseExchangeConnector(ABC):
             
         return all_records
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the connector's keep-alive client, creating it on first use (or after aclose)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+            self._owns_client = True
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the connector's own HTTP client. Injected clients are left to their owner."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
     @abstractmethod
     def get_daily_interval_string(self) -> str:
         """Returns the string representation for daily interval for this exchange."""
         pass
 
     @abstractmethod
-    async def get_latest_24h_volume(self, symbol: str) -> Optional[schemas.ExchangeVolumeInfo]:
+    async def get_latest_24h_volume(
+        self,
+        auth_params: Optional[Dict[str, Any]] = None,
+        symbols: Optional[List[str]] = None
+    ) -> Optional[schemas.ExchangeVolumeInfo]:
         """
-        Fetches the latest 24h trading volume for a specific symbol.
+        Fetches the latest 24h trading volume for the platform.
+        `symbols` are the markets configured for the platform; connectors that cannot
+        query an account-wide total sum over them, others may ignore them.
         Returns an ExchangeVolumeInfo structure (or relevant parts) 
         or None if data is unavailable.
         The 'date' field in the returned record should represent the end date of the 24h period.
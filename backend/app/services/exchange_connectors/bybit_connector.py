@@ -205,7 +205,11 @@ class BybitConnector(BaseExchangeConnector):
         print(f"Warning: Unknown interval '{interval}' for _interval_to_ms, defaulting to 1 day.")
         return 24 * 60 * 60 * 1000 # Default to 1 day
 
-    async def get_latest_24h_volume(self, auth_params: Optional[Dict[str, Any]] = None) -> Optional[schemas.ExchangeVolumeInfo]:
+    async def get_latest_24h_volume(
+        self,
+        auth_params: Optional[Dict[str, Any]] = None,
+        symbols: Optional[List[str]] = None # Unused: volume is platform-wide
+    ) -> Optional[schemas.ExchangeVolumeInfo]:
         # This method should aggregate volume for all relevant symbols for Bybit
         # For simplicity, let's assume we are interested in total USDT perp volume.
         # A more robust solution would get symbols from platform_symbol_map in AggregationService.
@@ -137,7 +137,11 @@ class HyperliquidConnector(BaseExchangeConnector):
 
     # _transform_kline_to_historical_volume_record is removed as transformation is now inline
 
-    async def get_latest_24h_volume(self, auth_params: Optional[Dict[str, Any]] = None) -> Optional[schemas.ExchangeVolumeInfo]:
+    async def get_latest_24h_volume(
+        self,
+        auth_params: Optional[Dict[str, Any]] = None,
+        symbols: Optional[List[str]] = None # Unused: volume is platform-wide
+    ) -> Optional[schemas.ExchangeVolumeInfo]:
         payload = {"type": "metaAndAssetCtxs"}
         total_volume_usd = Decimal("0.0")
         
@@ -1,8 +1,11 @@
 import httpx
-from datetime import datetime, date, timezone
-from typing import List, Dict, Any, Optional
+import orjson
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 import asyncio
+import functools
+import urllib.parse
 import logging # Added logging
 
 from .base_connector import BaseExchangeConnector
@@ -11,7 +14,76 @@ from ....models.api_key import PlatformEnum
 
 logger = logging.getLogger(__name__) # Added logger
 
+MS_PER_DAY = 86_400_000
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+PARADEX_MAX_IN_FLIGHT_REQUESTS = 40 # Max concurrent Paradex requests per process (an in-flight cap, not a per-second rate)
+
+
+class RateLimiter:
+    """
+    Shared gate for Paradex requests across all concurrent fetches.
+    Caps the number of in-flight requests and, when any caller hits a 429,
+    pauses every caller until the back-off has elapsed, so concurrent
+    window fetches back off and resume together.
+    """
+    def __init__(self, max_in_flight: int):
+        self._sem = asyncio.Semaphore(max_in_flight)
+        self._resume = asyncio.Event()
+        self._resume.set()
+        self._resume_at = 0.0
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self._resume.wait()
+        await self._sem.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._sem.release()
+
+    def pause_for(self, seconds: float) -> None:
+        """Blocks new requests for `seconds`. Overlapping pauses keep the latest deadline."""
+        loop = asyncio.get_running_loop()
+        resume_at = loop.time() + seconds
+        if resume_at <= self._resume_at:
+            return
+        self._resume_at = resume_at
+        self._resume.clear()
+        loop.call_at(resume_at, self._maybe_resume)
+
+    def _maybe_resume(self) -> None:
+        if asyncio.get_running_loop().time() >= self._resume_at:
+            self._resume.set()
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the process-wide Paradex RateLimiter.
+    Created lazily so its asyncio primitives bind to the running event loop.
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(PARADEX_MAX_IN_FLIGHT_REQUESTS)
+    return _rate_limiter
+
+@functools.lru_cache(maxsize=64)
+def _auth_headers(jwt_token: Optional[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Returns immutable request headers for a JWT, cached per token so the
+    pagination loop reuses one object instead of rebuilding a dict per request.
+    Headers are passed per request so clients stay user-neutral.
+    """
+    if not jwt_token:
+        return (("Accept", "application/json"),)
+    return (("Authorization", f"Bearer {jwt_token}"), ("Accept", "application/json"))
+
+
 class ParadexConnector(BaseExchangeConnector):
+    INITIAL_PAGE_SIZE = 500
+    MAX_PAGE_SIZE = 5000 # Paradex caps page_size for /v1/account/list-fills at 5000
+
     def get_platform_name(self) -> PlatformEnum:
         return PlatformEnum.PARADEX
 
@@ -29,85 +101,115 @@ class ParadexConnector(BaseExchangeConnector):
         start_time_ms: int,
         end_time_ms: int,
         auth_params: Optional[Dict[str, Any]] = None,
-        limit: Optional[int] = 5000 # Max page_size for Paradex
-    ) -> List[Dict[str, Any]]: # Return list of raw fill objects
+        limit: Optional[int] = None # Explicit page_size; None auto-tunes up to MAX_PAGE_SIZE
+    ) -> Tuple[List[Dict[str, Any]], bool, int]: # (raw fill objects, completed, missing_end_ms)
         """
         Fetches historical fills for a specific symbol and time range from Paradex.
         Handles pagination.
+
+        Returns `(fills, completed, missing_end_ms)`. Paradex returns fills newest
+        first, so pagination walks backwards from `end_time_ms`. `completed` is
+        False when pagination was aborted (errors, exhausted retries), in which
+        case `fills` is partial and only `[start_time_ms, missing_end_ms]` is
+        still missing: `missing_end_ms` is the oldest fill timestamp fetched (or
+        `end_time_ms` if nothing was), so callers can re-fetch only that range
+        and avoid treating partial data as complete.
+
+        When `limit` is not given the page size is auto-tuned: it starts at
+        INITIAL_PAGE_SIZE and doubles (up to MAX_PAGE_SIZE) every time a page
+        comes back full, so short ranges finish in one small page while long
+        backfills converge on maximum-size pages. Passing an explicit `limit`
+        disables the doubling.
         """
         all_fills: List[Dict[str, Any]] = []
         
         jwt_token = auth_params.get("jwt_token") if auth_params else None
         if not jwt_token:
             logger.error("ParadexConnector: JWT token not provided for /v1/account/list-fills.")
-            return []
+            return [], False, end_time_ms
 
-        headers = {"Authorization": f"Bearer {jwt_token}", "Accept": "application/json"}
+        headers = _auth_headers(jwt_token)
         
-        api_params: Dict[str, Any] = {
+        auto_page_size = not limit
+        page_size = limit or self.INITIAL_PAGE_SIZE
+        # Encode the query parameters that never change across pages once; only
+        # page_size and cursor are appended per request.
+        fills_path = f"{self.base_url}/v1/account/list-fills?" + urllib.parse.urlencode({
             "market": symbol,
             "start_at": start_time_ms,
             "end_at": end_time_ms,
-            "page_size": limit or 5000 # Use provided limit or max
-        }
+        })
         
         cursor: Optional[str] = None
+        oldest_fetched_ms = end_time_ms # Everything newer than this has been fetched
         max_retries = 3
         retry_delay_seconds = 5
+        limiter = get_rate_limiter()
 
-        async with httpx.AsyncClient(base_url=self.get_base_url(), headers=headers, timeout=self.REQUEST_TIMEOUT) as client:
-            while True: # Loop for pagination
-                current_retry = 0
-                if cursor:
-                    api_params["cursor"] = cursor
-                
-                while current_retry < max_retries:
-                    try:
-                        logger.info(f"Paradex: Attempt {current_retry + 1}/{max_retries} Fetching fills for symbol '{symbol}'. Params: {api_params}")
-                        response = await client.get("/v1/account/list-fills", params=api_params)
-
-                        if response.status_code == 429:
-                            logger.warning(f"Paradex rate limit hit for {symbol}. Retrying in {retry_delay_seconds}s...")
-                            await asyncio.sleep(retry_delay_seconds)
-                            current_retry += 1
-                            continue
-                        
-                        response.raise_for_status()
-                        data = response.json()
-                        
-                        page_fills = data.get("results", [])
-                        if isinstance(page_fills, list):
-                            all_fills.extend(page_fills)
-                        
-                        cursor = data.get("next")
-                        if not cursor: # No more pages
-                            return all_fills 
-                        
-                        # Successfully fetched a page, break retry loop and continue pagination
-                        break 
-
-                    except httpx.HTTPStatusError as e_http:
-                        logger.error(f"Paradex HTTP error for {symbol} (Attempt {current_retry + 1}): {e_http.response.status_code} - {e_http.response.text}")
-                        if e_http.response.status_code in [500, 502, 503, 504] and current_retry < max_retries - 1:
-                            await asyncio.sleep(retry_delay_seconds)
-                            current_retry += 1
-                        else:
-                            return all_fills # Return what we have so far on critical error
-                    except httpx.RequestError as e_req:
-                        logger.error(f"Paradex Request error for {symbol} (Attempt {current_retry + 1}): {e_req}")
-                        if current_retry < max_retries - 1:
-                            await asyncio.sleep(retry_delay_seconds)
-                            current_retry += 1
-                        else:
-                            return all_fills # Return what we have so far
-                    except Exception as e_gen:
-                        logger.error(f"Unexpected error fetching Paradex fills for {symbol} (Attempt {current_retry + 1}): {e_gen}", exc_info=True)
-                        return all_fills # Return what we have so far
-                
-                if current_retry == max_retries: # Exhausted retries for this page
-                    logger.error(f"Paradex: Max retries reached for page with cursor {api_params.get('cursor')}. Returning collected fills.")
-                    return all_fills
-        return all_fills # Should be unreachable if pagination loop breaks correctly
+        client = self._get_client()
+        while True: # Loop for pagination
+            current_retry = 0
+            # Paradex cursors are already URL-safe; quote() is defensive
+            cursor_query = f"&cursor={urllib.parse.quote(cursor)}" if cursor else ""
+            
+            while current_retry < max_retries:
+                if current_retry and auto_page_size: # Retry with the small starting page
+                    page_size = self.INITIAL_PAGE_SIZE
+                request_url = f"{fills_path}&page_size={page_size}{cursor_query}"
+                try:
+                    logger.info(f"Paradex: Attempt {current_retry + 1}/{max_retries} Fetching fills for symbol '{symbol}'. Request: {request_url}")
+                    async with limiter:
+                        response = await client.get(request_url, headers=headers)
+
+                    if response.status_code == 429:
+                        logger.warning(f"Paradex rate limit hit for {symbol}. Pausing all Paradex requests for {retry_delay_seconds}s...")
+                        limiter.pause_for(retry_delay_seconds) # The retry waits on the shared limiter
+                        current_retry += 1
+                        continue
+                    
+                    response.raise_for_status()
+                    data = orjson.loads(response.content) # Pages carry up to 5000 fills; orjson decodes them far faster than stdlib json
+                    
+                    page_fills = data.get("results", [])
+                    if isinstance(page_fills, list) and page_fills:
+                        all_fills.extend(page_fills)
+                        edge_ts = page_fills[-1].get("created_at") or page_fills[-1].get("timestamp") # Oldest fill on the page
+                        if edge_ts is not None:
+                            oldest_fetched_ms = min(oldest_fetched_ms, int(edge_ts))
+                    
+                    cursor = data.get("next")
+                    if not cursor: # No more pages
+                        return all_fills, True, end_time_ms
+                    
+                    # Full page means more data is likely; grow the page to cut round-trips
+                    if auto_page_size and len(page_fills) >= page_size:
+                        page_size = min(self.MAX_PAGE_SIZE, page_size * 2)
+
+                    # Successfully fetched a page, break retry loop and continue pagination
+                    break 
+
+                except httpx.HTTPStatusError as e_http:
+                    logger.error(f"Paradex HTTP error for {symbol} (Attempt {current_retry + 1}): {e_http.response.status_code} - {e_http.response.text}")
+                    if e_http.response.status_code in [500, 502, 503, 504] and current_retry < max_retries - 1:
+                        await asyncio.sleep(retry_delay_seconds)
+                        current_retry += 1
+                    else:
+                        return all_fills, False, oldest_fetched_ms # Return what we have so far on critical error
+                except httpx.RequestError as e_req:
+                    logger.error(f"Paradex Request error for {symbol} (Attempt {current_retry + 1}): {e_req}")
+                    if current_retry < max_retries - 1:
+                        await asyncio.sleep(retry_delay_seconds)
+                        current_retry += 1
+                    else:
+                        return all_fills, False, oldest_fetched_ms # Return what we have so far
+                except Exception as e_gen:
+                    logger.error(f"Unexpected error fetching Paradex fills for {symbol} (Attempt {current_retry + 1}): {e_gen}", exc_info=True)
+                    return all_fills, False, oldest_fetched_ms # Return what we have so far
+            
+            if current_retry == max_retries: # Exhausted retries for this page
+                logger.error(f"Paradex: Max retries reached for page with cursor {cursor}. Returning collected fills.")
+                return all_fills, False, oldest_fetched_ms
+        return all_fills, False, oldest_fetched_ms # Should be unreachable if pagination loop breaks correctly
 
     async def get_historical_klines(
         self,
@@ -119,7 +221,7 @@ class ParadexConnector(BaseExchangeConnector):
         limit: Optional[int] = None # Limit for page_size in get_user_historical_fills
     ) -> List[schemas.HistoricalKline]:
         
-        raw_fills = await self.get_user_historical_fills(
+        raw_fills, completed, missing_end_ms = await self.get_user_historical_fills(
             symbol=symbol,
             start_time_ms=start_time_ms,
             end_time_ms=end_time_ms,
@@ -127,37 +229,65 @@ class ParadexConnector(BaseExchangeConnector):
             limit=limit 
         )
 
+        if not completed and raw_fills:
+            # Re-fetch only the missing older range once; it is the whole gap, so its own completion
+            # decides ours. The boundary fill may come back again, so skip known ids.
+            # Without any fetched page (e.g. missing JWT, failing first request) a retry can't do better.
+            logger.warning(f"Paradex: Fills for {symbol} incomplete before {missing_end_ms}. Re-fetching the remaining range once.")
+            remaining_fills, completed, _ = await self.get_user_historical_fills(
+                symbol=symbol,
+                start_time_ms=start_time_ms,
+                end_time_ms=missing_end_ms,
+                auth_params=auth_params,
+                limit=limit
+            )
+            seen_fill_ids = {fill.get("id") for fill in raw_fills}
+            raw_fills.extend(fill for fill in remaining_fills if fill.get("id") is None or fill.get("id") not in seen_fill_ids)
+        if not completed:
+            logger.warning(f"Paradex: Fills for {symbol} remain incomplete; daily summaries may undercount volume.")
+
         if not raw_fills:
             return []
 
-        daily_aggregated_data: Dict[date, Dict[str, Decimal]] = {}
+        # Keyed by UTC day index (days since the Unix epoch); converted to datetimes once per day at emit time
+        daily_aggregated_data: Dict[int, Dict[str, Decimal]] = {}
+
+        # Assuming fill structure based on typical exchange fill data
+        # These field names are speculative and need to be confirmed from actual API response.
+        # Paradex returns a stable schema, so probe the first fill once instead of
+        # trying both names on every fill.
+        first_fill = raw_fills[0]
+        ts_key = "created_at" if "created_at" in first_fill else "timestamp" # Prefer 'created_at' if available
+        size_key = "size" if "size" in first_fill else "quantity" # 'size' or 'quantity'
 
         for fill in raw_fills:
             try:
-                # Assuming fill structure based on typical exchange fill data
-                # These field names are speculative and need to be confirmed from actual API response
-                timestamp_ms = int(fill.get("created_at") or fill.get("timestamp")) # Prefer 'created_at' if available
+                ts_value = fill.get(ts_key)
+                size_value = fill.get(size_key)
+                if ts_value is None or size_value is None: # Fill deviates from the probed schema (missing or null)
+                    ts_value = fill.get("created_at") or fill.get("timestamp")
+                    size_value = fill.get("size") or fill.get("quantity")
+                timestamp_ms = int(ts_value)
+                size_str = str(size_value)
                 price_str = str(fill.get("price"))
-                size_str = str(fill.get("size") or fill.get("quantity")) # 'size' or 'quantity'
                 # market_symbol = fill.get("market") # To ensure it matches requested symbol
 
                 # if market_symbol != symbol: # Should not happen if API filters by market
                 #     continue
 
-                dt_object = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-                current_date = dt_object.date()
+                day_index = timestamp_ms // MS_PER_DAY
 
                 price = Decimal(price_str)
                 size = Decimal(size_str)
                 quote_volume = price * size # This is the USD equivalent volume for this trade
 
-                if current_date not in daily_aggregated_data:
-                    daily_aggregated_data[current_date] = {
+                if day_index not in daily_aggregated_data:
+                    daily_aggregated_data[day_index] = {
                         "open": price, "high": price, "low": price, "close": price, 
                         "volume": Decimal("0.0") # This will be quote volume
                     }
                 
-                day_data = daily_aggregated_data[current_date]
+                day_data = daily_aggregated_data[day_index]
                 day_data["high"] = max(day_data["high"], price)
                 day_data["low"] = min(day_data["low"], price)
                 day_data["close"] = price # Last trade of the day will set this
@@ -167,10 +297,13 @@ class ParadexConnector(BaseExchangeConnector):
                 logger.warning(f"Paradex: Error processing fill data for {symbol}: {fill}. Error: {e}", exc_info=True)
                 continue
         
+        # Values are computed here and already type-correct, so skip pydantic validation
+        # (model_construct on pydantic v2, construct on v1).
+        construct_kline = getattr(schemas.HistoricalKline, "model_construct", None) or schemas.HistoricalKline.construct
         transformed_klines: List[schemas.HistoricalKline] = []
-        for record_date, data in sorted(daily_aggregated_data.items()):
-            transformed_klines.append(schemas.HistoricalKline(
-                timestamp=datetime(record_date.year, record_date.month, record_date.day, tzinfo=timezone.utc),
+        for day_index, data in sorted(daily_aggregated_data.items()):
+            transformed_klines.append(construct_kline(
+                timestamp=UNIX_EPOCH + timedelta(days=day_index),
                 open=data["open"],
                 high=data["high"],
                 low=data["low"],
@@ -180,12 +313,16 @@ class ParadexConnector(BaseExchangeConnector):
         
         return transformed_klines
 
-    async def get_latest_24h_volume(self, auth_params: Optional[Dict[str, Any]] = None) -> Optional[schemas.ExchangeVolumeInfo]:
+    async def get_latest_24h_volume(
+        self,
+        auth_params: Optional[Dict[str, Any]] = None,
+        symbols: Optional[List[str]] = None # Unused until per-market fill summing is implemented (see below)
+    ) -> Optional[schemas.ExchangeVolumeInfo]:
         """
         Calculates the total 24h personal trading volume by fetching recent fills.
         """
         now = datetime.now(timezone.utc)
-        start_of_24h_period_ms = int((now - asyncio.timedelta(hours=24)).timestamp() * 1000)
+        start_of_24h_period_ms = int((now - timedelta(hours=24)).timestamp() * 1000)
         end_of_24h_period_ms = int(now.timestamp() * 1000)
         
         total_volume_usd_24h = Decimal("0.0")
@@ -211,29 +348,27 @@ class ParadexConnector(BaseExchangeConnector):
         # A simpler approach if /v1/markets/summary provides user-specific 24h volume:
         
         jwt_token = auth_params.get("jwt_token") if auth_params else None
-        headers = {"Accept": "application/json"}
-        if jwt_token:
-            headers["Authorization"] = f"Bearer {jwt_token}"
+        headers = _auth_headers(jwt_token)
 
-        async with httpx.AsyncClient(base_url=self.get_base_url(), headers=headers, timeout=self.REQUEST_TIMEOUT) as client:
-            try:
-                logger.info(f"Paradex: Attempting to fetch /v1/markets/summary for 24h volume overview.")
-                response = await client.get("/v1/markets/summary") # This is likely public market data
-                response.raise_for_status()
-                data = response.json()
-                
-                results = data.get("results", [])
-                if not results or not isinstance(results, list):
-                    logger.warning(f"Paradex: No market summary data from /v1/markets/summary. Response: {data}")
-                    # Fallback to calculating from recent fills if summary is not user-specific or unavailable
-                else:
-                    # This is MARKET summary, not USER summary. We cannot use this for personal 24h volume.
-                    # We MUST calculate from user's fills.
-                    logger.info("Paradex: /v1/markets/summary provides market data, not user-specific 24h volume. Will calculate from fills.")
-                    pass # Proceed to calculate from fills
-
-            except Exception as e_summary:
-                logger.warning(f"Paradex: Error fetching /v1/markets/summary, will proceed to calculate from fills: {e_summary}")
+        client = self._get_client()
+        try:
+            logger.info(f"Paradex: Attempting to fetch /v1/markets/summary for 24h volume overview.")
+            response = await client.get(f"{self.base_url}/v1/markets/summary", headers=headers) # This is likely public market data
+            response.raise_for_status()
+            data = response.json()
+            
+            results = data.get("results", [])
+            if not results or not isinstance(results, list):
+                logger.warning(f"Paradex: No market summary data from /v1/markets/summary. Response: {data}")
+                # Fallback to calculating from recent fills if summary is not user-specific or unavailable
+            else:
+                # This is MARKET summary, not USER summary. We cannot use this for personal 24h volume.
+                # We MUST calculate from user's fills.
+                logger.info("Paradex: /v1/markets/summary provides market data, not user-specific 24h volume. Will calculate from fills.")
+                pass # Proceed to calculate from fills
+
+        except Exception as e_summary:
+            logger.warning(f"Paradex: Error fetching /v1/markets/summary, will proceed to calculate from fills: {e_summary}")
 
         # Calculate from user's fills (account-wide if possible, or iterate markets)
         # For now, this example won't iterate all markets due to complexity.
@@ -1,18 +1,46 @@
 import httpx
+import orjson
 import time
-import hashlib
+import binascii
 import hmac
-from datetime import datetime, date, timezone, timedelta
+import operator
+from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 from decimal import Decimal
 import asyncio
+import logging
+
+import numpy as np
+from aiolimiter import AsyncLimiter
 
 from .base_connector import BaseExchangeConnector
+from .._kernels import aggregate_ohlcv
 from .... import schemas # Import schemas directly
 from ....models.api_key import PlatformEnum
 from ....core.config import settings # For API keys if used directly by backend
 
+logger = logging.getLogger(__name__)
+
+MS_PER_DAY = 86_400_000
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+SIGNATURE_REUSE_SECONDS = 25 # WOO X rejects request timestamps older than ~30s
+# Pulls the fields aggregation needs from a trade row in one C-level call
+TRADE_FIELDS = operator.itemgetter("executed_timestamp", "executed_price", "executed_quantity")
+
 class WooXConnector(BaseExchangeConnector):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        extra_auth_params: Optional[Dict[str, Any]] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        super().__init__(api_key=api_key, api_secret=api_secret, extra_auth_params=extra_auth_params, client=client)
+        # UTF-8 bytes of each API secret used for signing, so pagination doesn't re-encode them per page
+        self._secret_cache: Dict[str, bytes] = {}
+        # WOO X private API rate limit is 5 req/sec; shared by all concurrent fetches on this connector
+        self._limiter = AsyncLimiter(5, 1)
+
     def get_platform_name(self) -> PlatformEnum:
         return PlatformEnum.WOOX
 
@@ -25,152 +53,180 @@ class WooXConnector(BaseExchangeConnector):
         # Not directly used for fetching trades, but conceptual for aggregation
         return "1d"
 
-    def _generate_signature_for_woox(self, timestamp_ms: str, query_params: Dict[str, Any], api_secret: str) -> str:
+    def _generate_signature_for_woox(self, timestamp_ms: str, sorted_query_string: str, api_secret: str) -> str:
         """
         Generates HMAC SHA256 signature for WOO X API private GET requests.
         stringToSign = sorted_query_string + "|" + timestamp
+        `sorted_query_string` must already be joined in sorted key order.
         """
-        sorted_query_string = "&".join([f"{k}={v}" for k, v in sorted(query_params.items())])
         string_to_sign = f"{sorted_query_string}|{timestamp_ms}"
-        
-        signature = hmac.new(
-            api_secret.encode('utf-8'),
-            string_to_sign.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+
+        key_bytes = self._secret_cache.get(api_secret)
+        if key_bytes is None:
+            key_bytes = self._secret_cache.setdefault(api_secret, api_secret.encode('utf-8'))
+
+        # One-shot hmac.digest runs entirely in C, skipping the HMAC object setup of hmac.new
+        signature = binascii.hexlify(
+            hmac.digest(key_bytes, string_to_sign.encode('utf-8'), 'sha256')
+        ).decode()
         return signature
 
-    async def _fetch_trades_from_endpoint(
+    async def _request_trades_page(
         self,
         endpoint_path: str,
         symbol: str,
-        start_time_ms: int,
-        end_time_ms: int,
-        auth_params: Dict[str, Any],
-        page_param_name: str, # "page" or "fromId"
-        page_size_param_name: str, # "size" or "limit"
-        initial_page_value: Any,
-        page_size: int
-    ) -> List[Dict[str, Any]]:
-        all_trades_data: List[Dict[str, Any]] = []
-        current_page_or_cursor = initial_page_value
-        
-        max_pages_safety = 200 # Safety break for pagination loops
-        loop_count = 0
+        sorted_query_string: str,
+        api_key: str,
+        api_secret: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetches one signed page from a WOO X trades endpoint, retrying rate limits,
+        5xx responses and network errors.
+        Returns the decoded response, or None if the page could not be fetched
+        (API error, non-retryable HTTP error or retries exhausted).
+        """
         max_retries = 3
         retry_delay_seconds = 5
-
-        api_key = auth_params.get("api_key")
-        api_secret = auth_params.get("api_secret")
-
-        if not api_key or not api_secret:
-            logging.error("WooXConnector: API key or secret not provided for private endpoint.")
-            return []
-
-        async with httpx.AsyncClient(base_url=self.get_base_url(public=False), timeout=self.REQUEST_TIMEOUT) as client:
-            while loop_count < max_pages_safety:
-                loop_count += 1
-                current_retry = 0
-                
-                timestamp_ms_str = str(int(time.time() * 1000))
-                query_params: Dict[str, Any] = {
-                    "symbol": symbol,
-                    "start_t": start_time_ms,
-                    "end_t": end_time_ms,
-                    page_param_name: current_page_or_cursor,
-                    page_size_param_name: page_size,
-                }
-                # Remove None values, convert all to str for sorting/signing
-                query_params_for_sign = {k: str(v) for k, v in query_params.items() if v is not None}
-
-
-                signature = self._generate_signature_for_woox(timestamp_ms_str, query_params_for_sign, api_secret)
-                
+        current_retry = 0
+        client = self._get_client()
+        # The signed string doubles as the request query (all values are URL-safe), so httpx
+        # sends it as-is instead of re-encoding a params dict
+        request_url = f"{self.base_url}{endpoint_path}?{sorted_query_string}"
+
+        headers: Dict[str, str] = {}
+        signed_at = float("-inf")
+
+        while current_retry < max_retries:
+            # Retries reuse the page's signature until it nears WOO X's timestamp validity window
+            if time.monotonic() - signed_at > SIGNATURE_REUSE_SECONDS:
+                timestamp_ms_str = str(time.time_ns() // 1_000_000) # Integer ms, no float rounding
+                signature = self._generate_signature_for_woox(timestamp_ms_str, sorted_query_string, api_secret)
                 headers = {
                     "x-api-key": api_key,
                     "x-api-signature": signature,
                     "x-api-timestamp": timestamp_ms_str,
-                    "Content-Type": "application/json" 
+                    "Content-Type": "application/json",
+                    "Accept-Encoding": "gzip, br" # Trade pages compress well; httpx decodes br via the brotli package
                 }
-
-                # Use query_params_for_sign for the actual request as well, as they are stringified
-                request_params = query_params_for_sign.copy() # Use a copy for the request
-
-                while current_retry < max_retries:
-                    try:
-                        logging.info(f"WooX: Attempt {current_retry + 1}/{max_retries} Fetching {endpoint_path} for {symbol}. Params: {request_params}")
-                        response = await client.get(endpoint_path, params=request_params, headers=headers)
-
-                        if response.status_code == 429:
-                            logging.warning(f"WooX rate limit hit for {symbol} at {endpoint_path}. Retrying in {retry_delay_seconds}s...")
-                            await asyncio.sleep(retry_delay_seconds)
-                            current_retry += 1
-                            continue
-                        
-                        response.raise_for_status()
-                        data = response.json()
-
-                        if not data.get("success"):
-                            api_msg = data.get('message', f'Unknown WooX API error at {endpoint_path}')
-                            logging.error(f"WooX API error for {symbol} ({endpoint_path}): {api_msg}. Response: {data}")
-                            return all_trades_data # Stop pagination on API error
-
-                        trades_page: List[Dict[str, Any]] = data.get("rows", []) # V1 /client/trades and /client/hist_trades use "rows"
-
-                        if not trades_page:
-                            return all_trades_data # No more data
-
-                        all_trades_data.extend(trades_page)
-                        
-                        if page_param_name == "page": # Page-based pagination for /v1/client/trades
-                            meta = data.get("meta", {})
-                            current_page_from_meta = meta.get("current_page", current_page_or_cursor)
-                            total_pages = meta.get("total_page", current_page_from_meta) # Assume current is total if not present
-                            if current_page_from_meta >= total_pages:
-                                return all_trades_data
-                            current_page_or_cursor += 1
-                        elif page_param_name == "fromId": # Cursor-based for /v1/client/hist_trades
-                            # WOO X hist_trades doesn't explicitly return a 'next_cursor'.
-                            # We infer by checking if fewer records than limit were returned,
-                            # or if the last trade's ID is the same as the current `fromId` (unlikely if new data).
-                            # A common pattern is to use the ID of the last fetched item as the next `fromId`.
-                            # However, WOO X docs say "If fromId is provided, the query will start after this trade_id."
-                            # This means we need the *first* ID of the next set, or rely on page size.
-                            # For simplicity, if len(trades_page) < page_size, assume end.
-                            # More robust: if last trade timestamp > end_time_ms, or if no new unique IDs.
-                            if len(trades_page) < page_size:
-                                return all_trades_data
-                            # For cursor, update fromId to the ID of the last trade fetched to get items *after* it.
-                            # WOO X API: "If fromId is provided, the query will start after this trade_id."
-                            # This means we need to use the ID of the *last* item in the current batch.
-                            current_page_or_cursor = trades_page[-1]["id"]
-                        
-                        await asyncio.sleep(0.2) # WOO X private API rate limit is 5 req/sec
-                        break # Success for this page/batch
-
-                    except httpx.HTTPStatusError as e_http:
-                        logging.error(f"WooX HTTP error for {symbol} ({endpoint_path}, Attempt {current_retry + 1}): {e_http.response.status_code} - {e_http.response.text}")
-                        if e_http.response.status_code in [500, 502, 503, 504] and current_retry < max_retries - 1:
-                            await asyncio.sleep(retry_delay_seconds)
-                            current_retry += 1
-                        else:
-                            return all_trades_data 
-                    except httpx.RequestError as e_req:
-                        logging.error(f"WooX Request error for {symbol} ({endpoint_path}, Attempt {current_retry + 1}): {e_req}")
-                        if current_retry < max_retries - 1:
-                            await asyncio.sleep(retry_delay_seconds)
-                            current_retry += 1
-                        else:
-                            return all_trades_data
-                    except Exception as e_gen:
-                        logging.error(f"Unexpected error fetching WooX trades for {symbol} ({endpoint_path}, Attempt {current_retry + 1}): {e_gen}", exc_info=True)
-                        return all_trades_data
+                signed_at = time.monotonic()
+            try:
+                logger.info(f"WooX: Attempt {current_retry + 1}/{max_retries} Fetching {request_url} for {symbol}.")
+                async with self._limiter:
+                    response = await client.get(request_url, headers=headers)
+
+                if response.status_code == 429:
+                    logger.warning(f"WooX rate limit hit for {symbol} at {endpoint_path}. Retrying in {retry_delay_seconds}s...")
+                    await asyncio.sleep(retry_delay_seconds)
+                    current_retry += 1
+                    continue
                 
-                if current_retry == max_retries:
-                    logging.error(f"WooX: Max retries reached for {endpoint_path} page/cursor {current_page_or_cursor}. Returning collected trades.")
-                    return all_trades_data
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                if not data.get("success"):
+                    api_msg = data.get('message', f'Unknown WooX API error at {endpoint_path}')
+                    logger.error(f"WooX API error for {symbol} ({endpoint_path}): {api_msg}. Response: {data}")
+                    return None # Stop pagination on API error
+                return data
+
+            except httpx.HTTPStatusError as e_http:
+                logger.error(f"WooX HTTP error for {symbol} ({endpoint_path}, Attempt {current_retry + 1}): {e_http.response.status_code} - {e_http.response.text}")
+                if e_http.response.status_code in [500, 502, 503, 504] and current_retry < max_retries - 1:
+                    await asyncio.sleep(retry_delay_seconds)
+                    current_retry += 1
+                else:
+                    return None
+            except httpx.RequestError as e_req:
+                logger.error(f"WooX Request error for {symbol} ({endpoint_path}, Attempt {current_retry + 1}): {e_req}")
+                if current_retry < max_retries - 1:
+                    await asyncio.sleep(retry_delay_seconds)
+                    current_retry += 1
+                else:
+                    return None
+            except Exception as e_gen:
+                logger.error(f"Unexpected error fetching WooX trades for {symbol} ({endpoint_path}, Attempt {current_retry + 1}): {e_gen}", exc_info=True)
+                return None
+
+        logger.error(f"WooX: Max retries reached for {request_url}. Stopping pagination.")
+        return None
+
+    async def _fetch_trades_page(
+        self,
+        symbol: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        api_key: str,
+        api_secret: str,
+        page_size: int
+    ) -> List[Dict[str, Any]]:
+        """Fetches recent trades from /v1/client/trades using page-number pagination."""
+        endpoint_path = "/v1/client/trades"
+        all_trades_data: List[Dict[str, Any]] = []
+        max_pages_safety = 200 # Safety break for pagination loops
+
+        # Signed query keys must be in sorted order; only `page` changes between requests
+        query_head = f"end_t={end_time_ms}"
+        query_tail = f"size={page_size}&start_t={start_time_ms}&symbol={symbol}"
+
+        page = 1
+        for _ in range(max_pages_safety):
+            data = await self._request_trades_page(endpoint_path, symbol, f"{query_head}&page={page}&{query_tail}", api_key, api_secret)
+            if data is None:
+                return all_trades_data
+
+            trades_page: List[Dict[str, Any]] = data.get("rows", []) # V1 /client/trades uses "rows"
+            if not trades_page:
+                return all_trades_data # No more data
+            all_trades_data.extend(trades_page)
+
+            meta = data.get("meta", {})
+            current_page_from_meta = meta.get("current_page", page)
+            total_pages = meta.get("total_page", current_page_from_meta) # Assume current is total if not present
+            if current_page_from_meta >= total_pages:
+                return all_trades_data
+            page += 1
         return all_trades_data
 
+    async def _fetch_trades_cursor(
+        self,
+        symbol: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        api_key: str,
+        api_secret: str,
+        page_size: int
+    ) -> List[Dict[str, Any]]:
+        """Fetches archived trades from /v1/client/hist_trades using `fromId` cursor pagination."""
+        endpoint_path = "/v1/client/hist_trades"
+        all_trades_data: List[Dict[str, Any]] = []
+        max_pages_safety = 200 # Safety break for pagination loops
+
+        # Signed query keys must be in sorted order; only `fromId` changes between requests.
+        # The first call omits fromId and relies on the time window
+        # (WOO X API: "start_t and end_t are required for /v1/client/hist_trades").
+        query_head = f"end_t={end_time_ms}"
+        query_tail = f"limit={page_size}&start_t={start_time_ms}&symbol={symbol}"
+
+        sorted_query_string = f"{query_head}&{query_tail}"
+        for _ in range(max_pages_safety):
+            data = await self._request_trades_page(endpoint_path, symbol, sorted_query_string, api_key, api_secret)
+            if data is None:
+                return all_trades_data
+
+            trades_page: List[Dict[str, Any]] = data.get("rows", []) # V1 /client/hist_trades uses "rows"
+            if not trades_page:
+                return all_trades_data # No more data
+            all_trades_data.extend(trades_page)
+
+            # WOO X hist_trades doesn't explicitly return a 'next_cursor'.
+            # For simplicity, if len(trades_page) < page_size, assume end.
+            # More robust: if last trade timestamp > end_time_ms, or if no new unique IDs.
+            if len(trades_page) < page_size:
+                return all_trades_data
+            # WOO X API: "If fromId is provided, the query will start after this trade_id."
+            # This means we need to use the ID of the *last* item in the current batch.
+            sorted_query_string = f"{query_head}&fromId={trades_page[-1]['id']}&{query_tail}"
+        return all_trades_data
 
     async def get_user_historical_trades(
         self,
@@ -182,7 +238,12 @@ class WooXConnector(BaseExchangeConnector):
     ) -> List[Dict[str, Any]]:
         
         if not auth_params:
-            logging.error("WooXConnector: auth_params (API key & secret) are required for fetching user trades.")
+            logger.error("WooXConnector: auth_params (API key & secret) are required for fetching user trades.")
+            return []
+        api_key = auth_params.get("api_key")
+        api_secret = auth_params.get("api_secret")
+        if not api_key or not api_secret:
+            logger.error("WooX: API key or secret missing in auth_params.")
             return []
 
         all_trades: List[Dict[str, Any]] = []
@@ -190,53 +251,44 @@ class WooXConnector(BaseExchangeConnector):
         # Define the 3-month boundary for WOO X trade history
         three_months_ago_ms = int((datetime.now(timezone.utc) - timedelta(days=90)).timestamp() * 1000)
 
+        # The recent and archived endpoints are independent, so build both fetches and run them concurrently
+        fetch_coros = []
+
         # Fetch recent trades (last 3 months) if the period overlaps
         if end_time_ms > three_months_ago_ms:
             recent_start_time_ms = max(start_time_ms, three_months_ago_ms)
-            logging.info(f"WooX: Fetching recent trades for {symbol} from {datetime.fromtimestamp(recent_start_time_ms/1000)} to {datetime.fromtimestamp(end_time_ms/1000)}")
-            recent_trades = await self._fetch_trades_from_endpoint(
-                endpoint_path="/v1/client/trades",
-                symbol=symbol,
-                start_time_ms=recent_start_time_ms,
-                end_time_ms=end_time_ms,
-                auth_params=auth_params,
-                page_param_name="page",
-                page_size_param_name="size",
-                initial_page_value=1,
-                page_size=limit_per_page or 100
-            )
-            all_trades.extend(recent_trades)
+            logger.info(f"WooX: Fetching recent trades for {symbol} from {datetime.fromtimestamp(recent_start_time_ms/1000)} to {datetime.fromtimestamp(end_time_ms/1000)}")
+            fetch_coros.append(self._fetch_trades_page(
+                symbol, recent_start_time_ms, end_time_ms, api_key, api_secret, limit_per_page or 100
+            ))
 
         # Fetch archived trades (older than 3 months) if the period overlaps
         if start_time_ms < three_months_ago_ms:
             archived_end_time_ms = min(end_time_ms, three_months_ago_ms -1) # Ensure no overlap
             if start_time_ms <= archived_end_time_ms: # Check if there's still a valid range
-                logging.info(f"WooX: Fetching archived trades for {symbol} from {datetime.fromtimestamp(start_time_ms/1000)} to {datetime.fromtimestamp(archived_end_time_ms/1000)}")
-                # For hist_trades, fromId is a cursor. Initial call might not need it or use a very old known ID if available.
-                # For simplicity, we'll start without fromId and rely on time window.
-                # WOO X API: "start_t and end_t are required for /v1/client/hist_trades"
-                archived_trades = await self._fetch_trades_from_endpoint(
-                    endpoint_path="/v1/client/hist_trades",
-                    symbol=symbol,
-                    start_time_ms=start_time_ms,
-                    end_time_ms=archived_end_time_ms,
-                    auth_params=auth_params,
-                    page_param_name="fromId", # This is a cursor, initial call might be tricky if no prior ID known.
-                                              # The API might work with just time range for the first call.
-                                              # If not, we might need to make an initial call to get a starting point or handle it.
-                                              # For now, assuming it works with time range for the first call, or we start with None.
-                    page_size_param_name="limit",
-                    initial_page_value=None, # Initial call for cursor-based might not need fromId
-                    page_size=limit_per_page or 100
-                )
-                all_trades.extend(archived_trades)
+                logger.info(f"WooX: Fetching archived trades for {symbol} from {datetime.fromtimestamp(start_time_ms/1000)} to {datetime.fromtimestamp(archived_end_time_ms/1000)}")
+                fetch_coros.append(self._fetch_trades_cursor(
+                    symbol, start_time_ms, archived_end_time_ms, api_key, api_secret, limit_per_page or 100
+                ))
+
+        for fetch_result in await asyncio.gather(*fetch_coros, return_exceptions=True):
+            if isinstance(fetch_result, Exception):
+                logger.error(f"WooX: Error fetching trades for {symbol}: {fetch_result}", exc_info=fetch_result)
+                continue
+            all_trades.extend(fetch_result)
         
         # Deduplicate and sort if necessary, though fetching distinct periods should minimize duplicates.
         # Sorting by timestamp is good practice.
-        unique_trades = {trade['id']: trade for trade in all_trades}
-        sorted_trades = sorted(list(unique_trades.values()), key=lambda x: x['executed_timestamp'])
+        seen_trade_ids = set()
+        unique_trades: List[Dict[str, Any]] = []
+        for trade in all_trades:
+            trade_id = trade['id']
+            if trade_id not in seen_trade_ids:
+                seen_trade_ids.add(trade_id)
+                unique_trades.append(trade)
+        unique_trades.sort(key=operator.itemgetter('executed_timestamp'))
         
-        return sorted_trades
+        return unique_trades
 
     async def get_historical_klines(
         self,
@@ -259,62 +311,132 @@ class WooXConnector(BaseExchangeConnector):
         if not raw_trades:
             return []
 
-        daily_aggregated_data: Dict[date, Dict[str, Decimal]] = {}
+        # Parsing and aggregation are CPU-bound; run them off the event loop so concurrent fetches keep going
+        return await asyncio.to_thread(self._aggregate_klines, raw_trades, start_time_ms, end_time_ms, symbol)
+
+    def _aggregate_klines(
+        self,
+        raw_trades: List[Dict[str, Any]],
+        start_time_ms: int,
+        end_time_ms: int,
+        symbol: str
+    ) -> List[schemas.HistoricalKline]:
+        """Aggregates raw WOO X trades into daily klines. Synchronous; called via asyncio.to_thread."""
+        # Parse trades into flat columns (skipping malformed rows), then reduce per day in NumPy.
+        # Aggregate in floats: Decimal arithmetic is far slower and the rounding error is negligible
+        # at daily OHLCV granularity. Values are converted to Decimal once per day at emit time.
+        # Requested period as integer UTC day bounds, so the per-trade range check is one division
+        min_day = start_time_ms // MS_PER_DAY
+        max_day = end_time_ms // MS_PER_DAY
+        day_indexes: List[int] = []
+        prices: List[float] = []
+        quantities: List[float] = []
+        skipped_trades = 0
 
         for trade in raw_trades:
             try:
                 # WOO X trade fields: executed_timestamp, executed_price, executed_quantity, fee, fee_asset, side
-                timestamp_ms = int(trade["executed_timestamp"])
-                price = Decimal(str(trade["executed_price"]))
-                quantity = Decimal(str(trade["executed_quantity"])) # This is base asset quantity
-                
-                # Volume for our schema is quote_volume (USD equivalent)
-                quote_volume = price * quantity 
-
-                dt_object = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-                current_date = dt_object.date()
-
-                if not (date.fromtimestamp(start_time_ms / 1000) <= current_date <= date.fromtimestamp(end_time_ms / 1000)):
+                executed_timestamp, executed_price, executed_quantity = TRADE_FIELDS(trade)
+                day_index = int(executed_timestamp) // MS_PER_DAY # UTC days since the Unix epoch
+                if day_index < min_day or day_index > max_day:
                     continue # Ensure trade is within the requested daily aggregation period
-
-                if current_date not in daily_aggregated_data:
-                    daily_aggregated_data[current_date] = {
-                        "open": price, "high": price, "low": price, "close": price, 
-                        "volume": Decimal("0.0") # Sum of quote volumes
-                    }
-                
-                day_data = daily_aggregated_data[current_date]
-                day_data["high"] = max(day_data["high"], price)
-                day_data["low"] = min(day_data["low"], price)
-                day_data["close"] = price # Last trade of the day will set this
-                day_data["volume"] += quote_volume
-            
+                price = float(executed_price)
+                quantity = float(executed_quantity) # This is base asset quantity
             except (KeyError, ValueError, TypeError) as e:
-                logging.warning(f"WooX: Error processing trade data for {symbol}: {trade}. Error: {e}", exc_info=True)
+                # No traceback here: formatting one per malformed row would dominate a bad page
+                logger.warning("WooX: bad trade %s: %r", trade.get("id"), e)
+                skipped_trades += 1
                 continue
-        
+            day_indexes.append(day_index)
+            prices.append(price)
+            quantities.append(quantity)
+
+        if skipped_trades:
+            logger.debug("WooX: skipped %d malformed trades for %s", skipped_trades, symbol)
+
+        if not day_indexes:
+            return []
+
+        day = np.array(day_indexes, dtype=np.int64)
+        price_arr = np.array(prices, dtype=np.float64)
+        # Volume for our schema is quote_volume (USD equivalent)
+        quote_volume_arr = price_arr * np.array(quantities, dtype=np.float64)
+
+        # Stable sort keeps trades in timestamp order within a day, so first/last give open/close
+        order = np.argsort(day, kind="stable")
+        day = day[order]
+        price_arr = price_arr[order]
+        quote_volume_arr = quote_volume_arr[order]
+
+        # Single native pass over the day-sorted trades (see services/_kernels.py)
+        n_trades = day.shape[0]
+        out_day = np.empty(n_trades, dtype=np.int64)
+        out_open = np.empty(n_trades, dtype=np.float64)
+        out_high = np.empty(n_trades, dtype=np.float64)
+        out_low = np.empty(n_trades, dtype=np.float64)
+        out_close = np.empty(n_trades, dtype=np.float64)
+        out_volume = np.zeros(n_trades, dtype=np.float64) # Sum of quote volumes
+        n_days = aggregate_ohlcv(day, price_arr, quote_volume_arr, out_day, out_open, out_high, out_low, out_close, out_volume)
+
+        kline_days = out_day[:n_days].tolist()
+        opens = out_open[:n_days].tolist()
+        highs = out_high[:n_days].tolist()
+        lows = out_low[:n_days].tolist()
+        closes = out_close[:n_days].tolist()
+        volumes = out_volume[:n_days].tolist()
+
         transformed_klines: List[schemas.HistoricalKline] = []
-        for record_date, data in sorted(daily_aggregated_data.items()):
+        for day_index, open_, high, low, close, volume in zip(kline_days, opens, highs, lows, closes, volumes):
             transformed_klines.append(schemas.HistoricalKline(
-                timestamp=datetime(record_date.year, record_date.month, record_date.day, tzinfo=timezone.utc),
-                open=data["open"],
-                high=data["high"],
-                low=data["low"],
-                close=data["close"],
-                volume=data["volume"] 
+                timestamp=UNIX_EPOCH + timedelta(days=day_index), # UTC midnight of the kline's day
+                open=Decimal(repr(open_)),
+                high=Decimal(repr(high)),
+                low=Decimal(repr(low)),
+                close=Decimal(repr(close)),
+                volume=Decimal(repr(volume))
             ))
         
         return transformed_klines
 
-    async def get_latest_24h_volume(self, auth_params: Optional[Dict[str, Any]] = None) -> Optional[schemas.ExchangeVolumeInfo]:
+    async def _symbol_volume(
+        self,
+        symbol: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        auth_params: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Decimal:
+        """Sums the quote volume (price * quantity) of the user's trades in one symbol."""
+        async with semaphore:
+            trades = await self.get_user_historical_trades(
+                symbol=symbol,
+                start_time_ms=start_time_ms,
+                end_time_ms=end_time_ms,
+                auth_params=auth_params,
+                limit_per_page=100 # Adjust as needed
+            )
+        symbol_volume = Decimal("0.0")
+        for trade in trades:
+            try:
+                _, executed_price, executed_quantity = TRADE_FIELDS(trade)
+                symbol_volume += Decimal(str(executed_price)) * Decimal(str(executed_quantity))
+            except (KeyError, ValueError, TypeError, ArithmeticError): # Handle potential errors in trade data
+                pass
+        return symbol_volume
+
+    async def get_latest_24h_volume(
+        self,
+        auth_params: Optional[Dict[str, Any]] = None,
+        symbols: Optional[List[str]] = None # Symbols the user trades on WOO X; required for a real total
+    ) -> Optional[schemas.ExchangeVolumeInfo]:
         now = datetime.now(timezone.utc)
-        start_of_24h_period_ms = int((now - timedelta(hours=24)).timestamp() * 1000)
-        end_of_24h_period_ms = int(now.timestamp() * 1000)
+        end_of_24h_period_ms = time.time_ns() // 1_000_000
+        start_of_24h_period_ms = end_of_24h_period_ms - MS_PER_DAY
         
         total_volume_usd_24h = Decimal("0.0")
 
         if not auth_params:
-            logging.error("WooXConnector: auth_params (API key & secret) are required for fetching 24h user volume.")
+            logger.error("WooXConnector: auth_params (API key & secret) are required for fetching 24h user volume.")
             return schemas.ExchangeVolumeInfo(
                 platform_name=self.get_platform_name().value,
                 volume_24h_usd=0.0,
@@ -322,39 +444,30 @@ class WooXConnector(BaseExchangeConnector):
                 error="API credentials not provided."
             )
 
-        # This is a simplification. In a real scenario, you'd need to know which symbols
-        # the user trades to fetch their volume accurately. Or, if WOO X has an account-wide
-        # trade history endpoint (not apparent from docs), that would be better.
-        # For now, we'll assume we need to be told which symbols to check or have a predefined list.
-        # As a placeholder, this function won't iterate all possible symbols.
-        # It should ideally fetch trades for *all* user's traded symbols in the last 24h.
-        
-        # Example: If we knew the user trades PERP_BTC_USDT and PERP_ETH_USDT
-        # symbols_to_check = ["PERP_BTC_USDT", "PERP_ETH_USDT"] 
-        # For now, we'll make it a placeholder that would need actual symbols.
-        
-        logging.warning("WooX: get_latest_24h_volume is a placeholder. A robust implementation needs to iterate user's traded markets or use an account-wide 24h volume endpoint if available.")
-        # To make this functional, one would loop through relevant user symbols:
-        # for symbol in user_traded_symbols_on_woox:
-        #     trades_24h = await self.get_user_historical_trades(
-        #         symbol=symbol,
-        #         start_time_ms=start_of_24h_period_ms,
-        #         end_time_ms=end_of_24h_period_ms,
-        #         auth_params=auth_params,
-        #         limit_per_page=100 # Adjust as needed
-        #     )
-        #     for trade in trades_24h:
-        #         try:
-        #             price = Decimal(str(trade["executed_price"]))
-        #             quantity = Decimal(str(trade["executed_quantity"]))
-        #             total_volume_usd_24h += price * quantity
-        #         except Exception: # Handle potential errors in trade data
-        #             pass
-        
+        # WOO X has no account-wide trade history endpoint (not apparent from docs), so the
+        # caller must tell us which symbols the user trades.
+        if not symbols:
+            logger.warning("WooX: get_latest_24h_volume called without symbols. A robust implementation needs to iterate user's traded markets or use an account-wide 24h volume endpoint if available.")
+            return schemas.ExchangeVolumeInfo(
+                platform_name=self.get_platform_name().value,
+                symbol="WOOX_ACCOUNT_TOTAL", # Placeholder
+                volume_24h_usd=0.0,
+                timestamp=now,
+                error="Accurate 24h total user volume requires iterating all traded markets; not fully implemented for WOOX."
+            )
+
+        # Fetch all symbols concurrently; the semaphore matches WOO X's 5 req/sec private API limit
+        semaphore = asyncio.Semaphore(5)
+        symbol_volumes = await asyncio.gather(*[
+            self._symbol_volume(symbol, start_of_24h_period_ms, end_of_24h_period_ms, auth_params, semaphore)
+            for symbol in symbols
+        ])
+        total_volume_usd_24h = sum(symbol_volumes, Decimal("0.0"))
+
         return schemas.ExchangeVolumeInfo(
             platform_name=self.get_platform_name().value,
-            symbol="WOOX_ACCOUNT_TOTAL", # Placeholder
-            volume_24h_usd=float(total_volume_usd_24h), # Placeholder
+            symbol="WOOX_ACCOUNT_TOTAL",
+            volume_24h_usd=float(total_volume_usd_24h),
             timestamp=now,
-            error="Accurate 24h total user volume requires iterating all traded markets; not fully implemented for WOOX." if total_volume_usd_24h == Decimal("0.0") else None
+            error=None
         )
@@ -1,11 +1,13 @@
 import asyncio
+import base64
 import time
 import os
 import logging
-from typing import Dict, List, Optional, Union, cast, Sequence
+from typing import Dict, List, Optional, Tuple, Sequence
 import functools
 
-import aiohttp
+import httpx
+import orjson
 from starknet_py.common import int_from_bytes
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.signer.stark_curve_signer import KeyPair
@@ -14,13 +16,11 @@ from starknet_py.net.client import Client
 from starknet_py.net.models import StarknetChainId, AddressRepresentation
 from starknet_py.net.signer import BaseSigner
 from starknet_py.utils.typed_data import TypedData as StarknetTypedDataDataclass
-from starknet_py.utils.typed_data import get_hex, is_pointer, strip_pointer
 from starknet_crypto_py import (
     get_public_key as rs_get_public_key,
     pedersen_hash as rs_pedersen_hash,
     sign as rs_sign,
 )
-from starkware.crypto.signature.signature import generate_k_rfc6979
 
 
 # --- Configuration ---
@@ -28,6 +28,14 @@ from starkware.crypto.signature.signature import generate_k_rfc6979
 # Ensure this matches the environment you are targeting.
 # For mainnet, it's typically "https://api.paradex.trade/v1"
 PARADEX_HTTP_URL = os.getenv("PARADEX_HTTP_URL", "https://api.testnet.paradex.trade/v1") 
+# System config rarely changes; refetch it at most this often
+PARADEX_CONFIG_TTL_SECONDS = 3600
+# Cached JWTs are reused until this close to expiry...
+JWT_REFRESH_MARGIN_SECONDS = 300
+# ...and refreshed in the background once inside this window
+JWT_BACKGROUND_REFRESH_SECONDS = 600
+# Extra RFC 6979 entropy for signing; 0 adds none (equivalent to starkware's seed=None)
+DEFAULT_SIGNING_SEED = 0
 
 # --- Logging Setup ---
 logging.basicConfig(
@@ -37,6 +45,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# --- Shared HTTP client ---
+# One HTTP/2 client for the config fetch and the /auth POST, so both ride the same pooled TLS connection
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _CLIENT
+
+async def aclose_client() -> None:
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
+
 # --- Helper functions from tradeparadex/code-samples ---
 
 # From helpers/utils.py
@@ -47,62 +75,10 @@ def compute_hash_on_elements(data: Sequence) -> int:
     return functools.reduce(pedersen_hash, [*data, len(data)], 0)
 
 def message_signature(
-    msg_hash: int, priv_key: int, seed: Optional[int] = None
+    msg_hash: int, priv_key: int, seed: int = DEFAULT_SIGNING_SEED
 ) -> tuple[int, int]:
-    k = generate_k_rfc6979(msg_hash, priv_key, seed)
-    return rs_sign(private_key=priv_key, msg_hash=msg_hash, k=k)
-
-# From helpers/typed_data.py (custom TypedData for Paradex)
-class ParadexTypedData(StarknetTypedDataDataclass):
-    def _encode_data(self, type_name: str, data: dict) -> List[int]:
-        values = []
-        for param_type_def in self.types[type_name]: # Iterate over type definitions
-            # Access param.name and param.type from the type definition object
-            param_name = param_type_def.get("name")
-            param_type = param_type_def.get("type")
-            if not param_name or not param_type:
-                raise ValueError(f"Malformed type definition for {type_name}: {param_type_def}")
-
-            encoded_value = self._encode_value(param_type, data[param_name])
-            values.append(encoded_value)
-        return values
-
-    def _encode_value(self, type_name: str, value: Union[int, str, dict, list]) -> int:
-        if is_pointer(type_name) and isinstance(value, list):
-            type_name = strip_pointer(type_name)
-            if self._is_struct(type_name):
-                return compute_hash_on_elements(
-                    [self.struct_hash(type_name, data) for data in value]
-                )
-            return compute_hash_on_elements([int(get_hex(val), 16) for val in value])
-
-        if self._is_struct(type_name) and isinstance(value, dict):
-            return self.struct_hash(type_name, value)
-
-        value = cast(Union[int, str], value)
-        # For felt, if it's already an int, use it. If string, convert from hex or encode.
-        if isinstance(value, str) and not value.startswith("0x"):
-             # Assuming short strings for non-hex felts if not explicitly a number
-            from starknet_py.cairo.felt import encode_shortstring
-            return encode_shortstring(value)
-        return int(get_hex(value), 16)
-
-
-    def struct_hash(self, type_name: str, data: dict) -> int:
-        return compute_hash_on_elements(
-            [self.type_hash(type_name), *self._encode_data(type_name, data)]
-        )
-
-    def message_hash(self, account_address: int) -> int:
-        from starknet_py.cairo.felt import encode_shortstring
-        message_parts = [
-            encode_shortstring("StarkNet Message"),
-            self.struct_hash("StarkNetDomain", cast(dict, self.domain)),
-            account_address,
-            self.struct_hash(self.primary_type, self.message),
-        ]
-        return compute_hash_on_elements(message_parts)
-
+    # starknet_crypto_py.sign derives the RFC 6979 nonce from (msg_hash, priv_key, seed) in Rust
+    return rs_sign(private_key=priv_key, msg_hash=msg_hash, seed=seed)
 
 # From helpers/account.py (custom Account for Paradex)
 class ParadexAccount(StarknetAccount):
@@ -120,8 +96,8 @@ class ParadexAccount(StarknetAccount):
         )
 
     def sign_message(self, typed_data: Dict) -> List[int]: # Accept dict
-        # Convert dict to ParadexTypedData instance before processing
-        typed_data_dataclass = ParadexTypedData.from_dict(typed_data)
+        # Hash with starknet-py's own TypedData implementation (from_dict always builds the upstream class)
+        typed_data_dataclass = StarknetTypedDataDataclass.from_dict(typed_data)
         msg_hash = typed_data_dataclass.message_hash(self.address)
         r, s = message_signature(msg_hash=msg_hash, priv_key=self.signer.key_pair.private_key)
         return [r, s]
@@ -155,33 +131,42 @@ def get_chain_id_enum(chain_id_str: str) -> StarknetChainId:
         raise ValueError(f"Unsupported chain_id string for StarknetChainId enum: {chain_id_str}")
 
 
-def get_paradex_l2_account(account_address: str, account_private_key: str, paradex_config_data: dict) -> ParadexAccount:
-    # Ensure account_private_key is an integer
-    if isinstance(account_private_key, str):
-        priv_key_int = int(account_private_key, 16)
-    else:
-        priv_key_int = account_private_key
+def get_paradex_l2_account(
+    account_address: str, priv_key_int: int, paradex_config_data: dict, chain_id_felt: int
+) -> ParadexAccount:
+    # chain_id_felt is the felt encoding of paradex_config_data["starknet_chain_id"], already computed by the caller.
+    # Pass scalars so the cached builder can key on them (the config dict itself isn't hashable)
+    return _build_paradex_l2_account(
+        account_address,
+        priv_key_int,
+        paradex_config_data["starknet_chain_id"],
+        chain_id_felt,
+        paradex_config_data["starknet_fullnode_rpc_url"],
+    )
 
+@functools.lru_cache(maxsize=8)
+def _build_paradex_l2_account(
+    account_address: str,
+    priv_key_int: int,
+    starknet_chain_id: str,
+    chain_id_felt: int,
+    fullnode_rpc_url: str,
+) -> ParadexAccount:
+    # Cached across JWT refreshes: KeyPair derivation is a STARK-curve scalar multiplication
     key_pair = KeyPair.from_private_key(key=priv_key_int)
     
     # The chain_id for the Account object in starknet-py
     # It can be an int or a StarknetChainId enum member.
     # The config's "starknet_chain_id" is a string like "PARADEX_TESTNET"
-    # We need to convert this to an int for the Account's chain parameter.
-    # starknet-py's Account class expects StarknetChainId enum or its value.
-    # Let's use int_from_bytes for consistency with how TypedData domain chainId is handled.
-    chain_id_for_account = int_from_bytes(paradex_config_data["starknet_chain_id"].encode("UTF-8"))
-
-
-    # If paradex_config_data["starknet_chain_id"] is "SN_MAIN", use StarknetChainId.MAINNET
-    # otherwise, it's a custom/testnet, pass the int value.
+    # If it names a standard chain like "SN_MAIN", use StarknetChainId.MAINNET;
+    # otherwise it's a custom/testnet, pass its felt value (same encoding as the TypedData domain chainId).
     try:
-        sn_chain_id_enum_val = StarknetChainId[paradex_config_data["starknet_chain_id"].upper()]
+        sn_chain_id_enum_val = StarknetChainId[starknet_chain_id.upper()]
     except KeyError: # Not a standard name like SN_MAIN, SN_SEPOLIA
-        sn_chain_id_enum_val = chain_id_for_account
+        sn_chain_id_enum_val = chain_id_felt
 
 
-    client = FullNodeClient(node_url=paradex_config_data["starknet_fullnode_rpc_url"])
+    client = FullNodeClient(node_url=fullnode_rpc_url)
     
     account = ParadexAccount(
         client=client,
@@ -191,68 +176,118 @@ def get_paradex_l2_account(account_address: str, account_private_key: str, parad
     )
     return account
 
+# Parts of the /auth typed-data message that never change; build_paradex_auth_message fills in the rest
+_AUTH_TEMPLATE = {
+    "message": {
+        "method": "POST",
+        "path": "/v1/auth", # Matching the path for JWT request
+        "body": "", # Body is empty for JWT request
+    },
+    "domain": {"name": "Paradex", "version": "1"},
+    "primaryType": "Request",
+    "types": {
+        "StarkNetDomain": [
+            {"name": "name", "type": "felt"},
+            {"name": "chainId", "type": "felt"},
+            {"name": "version", "type": "felt"},
+        ],
+        "Request": [
+            {"name": "method", "type": "felt"},
+            {"name": "path", "type": "felt"},
+            {"name": "body", "type": "felt"},
+            {"name": "timestamp", "type": "felt"},
+            {"name": "expiration", "type": "felt"},
+        ],
+    },
+}
+
 def build_paradex_auth_message(chain_id_hex_str: str, timestamp: int, expiration: int) -> Dict:
     # chain_id_hex_str should be like "0x..." or the direct int as string
     # The TypedData domain expects 'felt' for chainId, which starknet-py handles from int/hex string.
+    # "types" is shared with the template; callers must treat it as read-only.
     return {
-        "message": {
-            "method": "POST",
-            "path": "/v1/auth", # Matching the path for JWT request
-            "body": "", # Body is empty for JWT request
-            "timestamp": timestamp,
-            "expiration": expiration,
-        },
-        "domain": {"name": "Paradex", "chainId": chain_id_hex_str, "version": "1"},
-        "primaryType": "Request",
-        "types": {
-            "StarkNetDomain": [
-                {"name": "name", "type": "felt"},
-                {"name": "chainId", "type": "felt"},
-                {"name": "version", "type": "felt"},
-            ],
-            "Request": [
-                {"name": "method", "type": "felt"},
-                {"name": "path", "type": "felt"},
-                {"name": "body", "type": "felt"},
-                {"name": "timestamp", "type": "felt"},
-                {"name": "expiration", "type": "felt"},
-            ],
-        },
+        "message": {**_AUTH_TEMPLATE["message"], "timestamp": timestamp, "expiration": expiration},
+        "domain": {**_AUTH_TEMPLATE["domain"], "chainId": chain_id_hex_str},
+        "primaryType": _AUTH_TEMPLATE["primaryType"],
+        "types": _AUTH_TEMPLATE["types"],
     }
 
 def flatten_signature(sig: list[int]) -> str:
-    return f'["{sig[0]}","{sig[1]}"]'
+    # JSON array of decimal strings: ["r","s"]
+    return orjson.dumps([str(sig[0]), str(sig[1])]).decode()
+
+# (fetched_at, config) per API URL
+_config_cache: Dict[str, Tuple[float, Dict]] = {}
+
+@functools.lru_cache(maxsize=4)
+def _chain_ids(chain_id_str: str) -> Tuple[int, str]:
+    # Felt encoding of the config's chain id string (e.g. "PRIVATE_SN_POTC_SEPOLIA") and its hex form
+    felt = int_from_bytes(chain_id_str.encode("UTF-8"))
+    return felt, hex(felt)
 
 async def get_paradex_system_config(paradex_http_url: str) -> Dict:
+    cached = _config_cache.get(paradex_http_url)
+    if cached is not None and time.time() - cached[0] < PARADEX_CONFIG_TTL_SECONDS:
+        return cached[1]
+
     path = "/system/config"
     full_url = f"{paradex_http_url}{path}"
     logger.info(f"Fetching Paradex system config from: {full_url}")
-    async with aiohttp.ClientSession() as session:
-        async with session.get(full_url) as response:
-            response.raise_for_status() # Raise an exception for HTTP errors
-            config_data = await response.json()
-            logger.info(f"Paradex system config received: {config_data}")
-            return config_data
+    response = await _get_client().get(full_url)
+    response.raise_for_status() # Raise an exception for HTTP errors
+    config_data = orjson.loads(response.content)
+    logger.info(f"Paradex system config received: {config_data}")
+    _config_cache[paradex_http_url] = (time.time(), config_data)
+    return config_data
+
+# address -> (jwt, exp unix seconds)
+_jwt_cache: Dict[str, Tuple[str, int]] = {}
+_jwt_refresh_tasks: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+
+def _jwt_expiry(token: str, fallback: int) -> int:
+    # Read the "exp" claim from the (unverified) payload segment; fall back to the requested expiry
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return int(orjson.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return fallback
 
 async def generate_jwt(paradex_l2_address: str, paradex_l2_private_key: str) -> Optional[str]:
+    cached = _jwt_cache.get(paradex_l2_address)
+    now = int(time.time())
+    if cached is not None and now < cached[1] - JWT_REFRESH_MARGIN_SECONDS:
+        # Still valid: hand it out, kicking off a single background refresh as expiry approaches
+        if now >= cached[1] - JWT_BACKGROUND_REFRESH_SECONDS and paradex_l2_address not in _jwt_refresh_tasks:
+            task = asyncio.create_task(_request_jwt(paradex_l2_address, paradex_l2_private_key))
+            _jwt_refresh_tasks[paradex_l2_address] = task
+            task.add_done_callback(lambda _: _jwt_refresh_tasks.pop(paradex_l2_address, None))
+        return cached[0]
+    return await _request_jwt(paradex_l2_address, paradex_l2_private_key)
+
+async def _request_jwt(paradex_l2_address: str, paradex_l2_private_key: str) -> Optional[str]:
     try:
         logger.info("Attempting to generate Paradex JWT...")
+        # Normalize the key once here; account construction only accepts ints
+        priv_key_int = int(paradex_l2_private_key, 16) if isinstance(paradex_l2_private_key, str) else paradex_l2_private_key
         paradex_config_data = await get_paradex_system_config(PARADEX_HTTP_URL)
-        
-        # The chain_id for the EIP-712 domain needs to be a hex string or int.
-        # The config provides starknet_chain_id as a string (e.g., "PARADEX_TESTNET").
-        # int_from_bytes converts this string to its felt representation.
-        domain_chain_id_felt = int_from_bytes(paradex_config_data["starknet_chain_id"].encode("UTF-8"))
-        domain_chain_id_hex = hex(domain_chain_id_felt)
 
-        account = get_paradex_l2_account(paradex_l2_address, paradex_l2_private_key, paradex_config_data)
-        
         now = int(time.time())
         # JWT Expiry: 7 days from now (Paradex max is 1 week, default 30 mins)
         # The /auth endpoint's PARADEX-SIGNATURE-EXPIRATION is for the signature on the request,
         # not necessarily the JWT's own expiry, but it's good practice to align them.
         # The example used 24h for the signature expiry. Let's use 7 days for the JWT request.
         expiry = now + (7 * 24 * 60 * 60 - 60) # 7 days minus a minute for buffer
+        auth_url = f"{PARADEX_HTTP_URL}/auth"
+        
+        # The chain_id for the EIP-712 domain needs to be a hex string or int.
+        # The config provides starknet_chain_id as a string (e.g., "PARADEX_TESTNET").
+        # int_from_bytes converts this string to its felt representation.
+        domain_chain_id_felt, domain_chain_id_hex = _chain_ids(paradex_config_data["starknet_chain_id"])
+
+        account = get_paradex_l2_account(
+            paradex_l2_address, priv_key_int, paradex_config_data, domain_chain_id_felt
+        )
 
         auth_typed_data = build_paradex_auth_message(domain_chain_id_hex, now, expiry)
         
@@ -266,18 +301,18 @@ async def generate_jwt(paradex_l2_address: str, paradex_l2_private_key: str) ->
             "PARADEX-SIGNATURE-EXPIRATION": str(expiry),
         }
         
-        auth_url = f"{PARADEX_HTTP_URL}/auth"
         logger.info(f"Requesting JWT from {auth_url} with headers: {headers}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(auth_url, headers=headers) as response:
-                resp_json = await response.json()
-                if response.status == 200 and "jwt_token" in resp_json:
-                    logger.info(f"Successfully obtained JWT: {resp_json['jwt_token']}")
-                    return resp_json["jwt_token"]
-                else:
-                    logger.error(f"Failed to obtain JWT. Status: {response.status}, Response: {resp_json}")
-                    return None
+        response = await _get_client().post(auth_url, headers=headers)
+        resp_json = orjson.loads(response.content)
+        if response.status_code == 200 and "jwt_token" in resp_json:
+            logger.info(f"Successfully obtained JWT: {resp_json['jwt_token']}")
+            jwt_token = resp_json["jwt_token"]
+            _jwt_cache[paradex_l2_address] = (jwt_token, _jwt_expiry(jwt_token, expiry))
+            return jwt_token
+        else:
+            logger.error(f"Failed to obtain JWT. Status: {response.status_code}, Response: {resp_json}")
+            return None
     except Exception as e:
         logger.error(f"Error generating JWT: {e}", exc_info=True)
         return None
@@ -296,7 +331,10 @@ async def main():
         print("export PARADEX_L2_PRIVATE_KEY=\"0x...\"")
         return
 
-    jwt = await generate_jwt(paradex_l2_address, paradex_l2_private_key)
+    try:
+        jwt = await generate_jwt(paradex_l2_address, paradex_l2_private_key)
+    finally:
+        await aclose_client()
     if jwt:
         print("\nSuccessfully generated Paradex JWT:")
         print(jwt)
@@ -304,7 +342,12 @@ async def main():
         print("\nFailed to generate Paradex JWT.")
 
 if __name__ == "__main__":
-    # This script requires: aiohttp, starknet-py, starknet-crypto-py
+    # This script requires: httpx[http2], orjson, starknet-py, starknet-crypto-py
     # You can install them using:
-    # pip install aiohttp "starknet-py>=0.22.0" starknet-crypto-py
+    # pip install "httpx[http2]" orjson "starknet-py>=0.22.0" "starknet-crypto-py>=0.2.0"
+    try:
+        import uvloop # Optional: faster event loop for the config -> sign -> auth sequence
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
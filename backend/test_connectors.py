@@ -3,6 +3,9 @@ from datetime import datetime, timedelta, timezone
 import os
 import sys
 from decimal import Decimal
+from typing import Dict
+
+import httpx
 
 # Adjust path to import app modules
 # This assumes the script is run from `aggrperpvol/backend/` or `aggrperpvol/`
@@ -83,15 +86,14 @@ async def test_connector_historical_klines(connector: BaseExchangeConnector, sym
         traceback.print_exc()
 
 async def test_connector_24h_volume(connector: BaseExchangeConnector, symbol_for_platform: str):
-    # Note: get_latest_24h_volume in connectors is now designed to return platform total,
-    # so the 'symbol_for_platform' is more for context here, not directly passed if method doesn't take it.
+    # Connectors without an account-wide total (e.g. WOO X) sum volume over the symbols passed in
     print(f"\n--- Testing get_latest_24h_volume for {connector.get_platform_name().value} ---")
     
     auth_params = TEST_API_KEYS.get(connector.get_platform_name())
 
     try:
         # Pass auth_params to the connector method
-        volume_info = await connector.get_latest_24h_volume(auth_params=auth_params)
+        volume_info = await connector.get_latest_24h_volume(auth_params=auth_params, symbols=[symbol_for_platform])
         
         if volume_info:
             print(f"Platform: {volume_info.platform_name}")
@@ -109,34 +111,47 @@ async def test_connector_24h_volume(connector: BaseExchangeConnector, symbol_for
         traceback.print_exc()
 
 async def main():
-    # --- Select which connector to test ---
-    # platform_to_test = PlatformEnum.WOOX
-    platform_to_test = PlatformEnum.PARADEX # Default to Paradex for testing
-
-    connector: Optional[BaseExchangeConnector] = None
-    symbol = ""
-
-    if platform_to_test == PlatformEnum.WOOX:
-        connector = WooXConnector()
-        symbol = TEST_SYMBOLS[PlatformEnum.WOOX]
-    elif platform_to_test == PlatformEnum.PARADEX:
-        connector = ParadexConnector()
-        symbol = TEST_SYMBOLS[PlatformEnum.PARADEX]
-    else:
-        print(f"Connector for {platform_to_test.value} not implemented or selected in this script.")
-        return
-
-    if connector:
-        # Test fetching user's historical daily trade summaries
-        # Ensure you have valid API keys/JWT in TEST_API_KEYS.
-        print(f"Ensure you have valid API credentials in TEST_API_KEYS for {platform_to_test.value}")
-        print(f"and that the test user has traded the symbol '{symbol}' in the last 8 days.")
-        await test_connector_historical_klines(connector, symbol)
-        
-        print("-" * 50)
-        
-        # Test fetching user's 24h personal volume
-        await test_connector_24h_volume(connector, symbol) # symbol is for context here
+    # All connectors share one pooled HTTP/2 client, so the run exercises connection reuse end to end
+    shared_client = httpx.AsyncClient(
+        http2=True,
+        timeout=BaseExchangeConnector.REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    )
+    connectors: Dict[PlatformEnum, BaseExchangeConnector] = {
+        PlatformEnum.WOOX: WooXConnector(client=shared_client),
+        PlatformEnum.PARADEX: ParadexConnector(client=shared_client),
+    }
+
+    # Test fetching user's historical daily trade summaries and 24h personal volume.
+    # Ensure you have valid API keys/JWT in TEST_API_KEYS.
+    for platform, connector in connectors.items():
+        print(f"Ensure you have valid API credentials in TEST_API_KEYS for {platform.value}")
+        print(f"and that the test user has traded the symbol '{TEST_SYMBOLS[platform]}' in the last 8 days.")
+
+    # The probes are read-only and hit independent endpoints, so run them all concurrently
+    # (their output may interleave)
+    probes = []
+    for platform, connector in connectors.items():
+        symbol = TEST_SYMBOLS[platform]
+        probes.append(test_connector_historical_klines(connector, symbol))
+        probes.append(test_connector_24h_volume(connector, symbol))
+
+    try:
+        if hasattr(asyncio, "TaskGroup"): # Python 3.11+
+            async with asyncio.TaskGroup() as tg:
+                for probe in probes:
+                    tg.create_task(probe)
+        else:
+            await asyncio.gather(*probes)
+    finally:
+        await shared_client.aclose()
+
+    print("-" * 50)
 
 if __name__ == "__main__":
+    try:
+        import uvloop # Installed with uvicorn[standard]; fall back to the default loop without it
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())